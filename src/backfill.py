@@ -0,0 +1,258 @@
+"""
+Backfill an archive of past weekly editions.
+
+Every series is fetched once up front: its full ALFRED release history where
+available, otherwise its revised history with each observation treated as
+published `release_lag_days` (from the catalog) after its date. Each series is
+indexed once so that its values as known on any date are a searchsorted lookup.
+The card values and statistical context of every edition are then computed in
+one vectorized pass per series over all edition dates, and the editions'
+charts are sliced and rendered in parallel worker processes.
+
+Statistical context uses each observation's first-release values (statistics
+as they stood when the edition's latest observation was published); card
+values, changes and charts use the values as revised by the edition date.
+
+Usage: python src/backfill.py --start 2020-10-19 --end 2025-10-13 --output archive
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from dotenv import load_dotenv
+
+from catalog import load_catalog
+from fetch_data import EconomicDataFetcher
+from generate_charts import render_charts
+from generate_report import generate_html_report
+from indicator_stats import STAT_FIELDS, compute_series_stats, stats_to_dict
+
+# Release histories shared with each worker process (set once by _init_worker)
+_worker_releases = None
+
+def edition_dates(start, end):
+    """Every Monday between start and end (inclusive)"""
+    return pd.date_range(start, end, freq='W-MON')
+
+def _to_days(dates):
+    return np.asarray(dates).astype('datetime64[D]').astype(np.int64)
+
+class ReleaseHistory:
+    """One series' releases, indexed for as-of lookups on any date"""
+
+    def __init__(self, dates, available, values):
+        """dates/available: datetime64 arrays sorted by observation date, then publication date"""
+        new_obs = np.r_[True, dates[1:] != dates[:-1]]
+        starts = np.flatnonzero(new_obs)
+        obs_index = np.cumsum(new_obs) - 1
+        available_days = _to_days(available)
+
+        self.obs_dates = dates[starts]
+        self.first_release = values[starts]
+        self.values = values
+
+        # An observation is only treated as known once every earlier one is too,
+        # so the number of known observations is a searchsorted lookup
+        self.first_known = np.maximum.accumulate(available_days[starts])
+
+        # (observation, publication day) packed into one sorted key: the latest
+        # release of observation k known on day d is the last key <= key(k, d)
+        self.keys = (obs_index << 32) + (available_days + 2 ** 31)
+
+    def known_count(self, days):
+        """Number of observations published by each day"""
+        return np.searchsorted(self.first_known, days, side='right')
+
+    def values_as_of(self, obs, days):
+        """Value of observation(s) obs as revised by day(s) days (obs must be known by then)"""
+        rows = np.searchsorted(self.keys, (obs << 32) + (days + 2 ** 31), side='right') - 1
+        return self.values[rows]
+
+    def as_of(self, date, start=None):
+        """The series as known on date, from start on (observations not yet published are left out)"""
+        day = _to_days(np.datetime64(date, 'D'))
+        end = self.known_count(day)
+        begin = 0 if start is None else min(np.searchsorted(self.obs_dates, np.datetime64(start, 'ns')), end)
+        obs = np.arange(begin, end)
+        return pd.Series(self.values_as_of(obs, day), index=pd.DatetimeIndex(self.obs_dates[begin:end]))
+
+def load_releases(fetcher, use_vintage=True):
+    """Fetch every catalog series once, returning {series_id: ReleaseHistory}"""
+    releases_by_id = {}
+
+    for indicator in load_catalog().indicators:
+        series_id = indicator.series_id
+
+        if use_vintage:
+            try:
+                releases = fetcher.fetch_series_releases(series_id)
+                if not releases.empty:
+                    releases_by_id[series_id] = ReleaseHistory(
+                        releases['date'].values.astype('datetime64[ns]'),
+                        releases['available_at'].values.astype('datetime64[ns]'),
+                        releases['value'].to_numpy(dtype=float),
+                    )
+                    print(f"✓ Loaded release history for {series_id} ({len(releases)} releases)")
+                    continue
+            except Exception as e:
+                print(f"⚠ No ALFRED releases for {series_id}: {str(e)[:100]}")
+
+        try:
+            history = fetcher.fetch_series_history(series_id).sort_index()
+        except Exception as e:
+            print(f"✗ Error fetching history for {series_id}: {str(e)[:100]}")
+            continue
+
+        if history.empty:
+            continue
+
+        dates = history.index.values.astype('datetime64[ns]')
+        lag = np.timedelta64(indicator.release_lag_days, 'D')
+        releases_by_id[series_id] = ReleaseHistory(dates, dates + lag, history.to_numpy(dtype=float))
+        print(f"✓ Loaded revised history for {series_id} ({len(history)} observations, "
+              f"assumed published {indicator.release_lag_days} days after each observation)")
+
+    return releases_by_id
+
+def compute_editions(releases_by_id, dates):
+    """
+    Compute every edition's card values and statistical context
+    Returns {edition_date: economic_data} in the same shape as fetch_economic_indicators()
+    """
+    catalog = load_catalog()
+    edition_days = _to_days(dates.values)
+    editions = {date: {} for date in dates}
+
+    for indicator in catalog.indicators:
+        history = releases_by_id.get(indicator.series_id)
+        if history is None:
+            continue
+
+        # Latest known observation for each edition
+        known = history.known_count(edition_days)
+        valid = known > 0
+        if not valid.any():
+            continue
+        latest = known[valid] - 1
+        days = edition_days[valid]
+
+        current = history.values_as_of(latest, days)
+        previous = np.where(latest > 0, history.values_as_of(np.maximum(latest - 1, 0), days), current)
+
+        # Statistics as they stood at each observation, read off at each edition's latest one
+        first_release = pd.Series(history.first_release, index=pd.DatetimeIndex(history.obs_dates))
+        percent = indicator.units == 'percent'
+        stats = compute_series_stats(first_release, percent).to_numpy()[latest]
+
+        frame = pd.DataFrame({
+            'current': current,
+            'change': current - previous,
+            'date': pd.DatetimeIndex(history.obs_dates[latest]).strftime('%Y-%m-%d'),
+            **{field: stats[:, i] for i, field in enumerate(STAT_FIELDS)},
+            'units': 'pp' if percent else '%',
+        }, index=dates[valid])
+
+        for date, entry in stats_to_dict(frame).items():
+            editions[date][indicator.name] = {**entry, 'section': indicator.section}
+
+    return editions
+
+def _init_worker(releases_by_id):
+    global _worker_releases
+    _worker_releases = releases_by_id
+
+def _render_edition(edition_date, economic, output_path, include_charts):
+    """Render a single edition to output_path (runs in a worker process)"""
+    charts = {}
+    if include_charts:
+        start_date = edition_date - timedelta(days=730)
+        histories = {
+            series_id: _worker_releases[series_id].as_of(edition_date, start_date)
+            for series_id in load_catalog().chart_series_ids
+            if series_id in _worker_releases
+        }
+        charts = render_charts(histories, start_date, edition_date, verbose=False)
+
+    data = {'timestamp': edition_date.isoformat(), 'economic': economic}
+    html, _ = generate_html_report(data, charts=charts, report_date=edition_date)
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(html)
+
+    return output_path
+
+def backfill(start, end, output_dir='archive', include_charts=True, use_vintage=True,
+             workers=None, overwrite=False):
+    """Generate one HTML edition per Monday between start and end"""
+
+    load_dotenv()
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    dates = edition_dates(start, end)
+    pending = [d for d in dates if overwrite or not (output_dir / f"{d:%Y-%m-%d}.html").exists()]
+    print(f"{len(dates)} editions in range, {len(pending)} to generate")
+    if not pending:
+        return []
+
+    # Step 1: Fetch every series once (cache lasts a week)
+    print("\n[1/3] Loading series release histories...")
+    fetcher = EconomicDataFetcher(use_cache=True, cache_duration_hours=24 * 7)
+    releases_by_id = load_releases(fetcher, use_vintage=use_vintage)
+
+    # Step 2: Compute all editions' values
+    print("\n[2/3] Computing edition values...")
+    editions = compute_editions(releases_by_id, pd.DatetimeIndex(pending))
+
+    # Step 3: Render in parallel
+    print(f"\n[3/3] Rendering {len(pending)} editions...")
+    written = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(releases_by_id,)) as pool:
+        futures = {
+            pool.submit(
+                _render_edition,
+                date.to_pydatetime(),
+                editions[date],
+                output_dir / f"{date:%Y-%m-%d}.html",
+                include_charts,
+            ): date
+            for date in pending
+        }
+        for future in as_completed(futures):
+            date = futures[future]
+            try:
+                written.append(future.result())
+                print(f"✓ Rendered edition {date:%Y-%m-%d}")
+            except Exception as e:
+                print(f"✗ Error rendering edition {date:%Y-%m-%d}: {str(e)[:100]}")
+
+    return sorted(written)
+
+if __name__ == '__main__':
+    today = datetime.now()
+
+    parser = argparse.ArgumentParser(description='Backfill past weekly report editions')
+    parser.add_argument('--start', default=(today - timedelta(days=5 * 365)).strftime('%Y-%m-%d'))
+    parser.add_argument('--end', default=today.strftime('%Y-%m-%d'))
+    parser.add_argument('--output', default='archive')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--no-charts', action='store_true', help='Skip chart rendering')
+    parser.add_argument('--no-vintage', action='store_true', help='Use revised history with catalog release lags instead of ALFRED releases')
+    parser.add_argument('--overwrite', action='store_true', help='Regenerate editions that already exist')
+    args = parser.parse_args()
+
+    written = backfill(
+        args.start,
+        args.end,
+        output_dir=args.output,
+        include_charts=not args.no_charts,
+        use_vintage=not args.no_vintage,
+        workers=args.workers,
+        overwrite=args.overwrite,
+    )
+    print(f"\n✓ Backfill complete: {len(written)} editions written to {args.output}/")
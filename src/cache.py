@@ -13,8 +13,8 @@ class DataCache:
         """Get the file path for a cache key"""
         return self.cache_dir / f"{key}.json"
     
-    def get(self, key):
-        """Get cached data if it exists and is fresh"""
+    def get(self, key, check_expiry=True):
+        """Get cached data if it exists and is fresh (check_expiry=False for entries validated by content)"""
         cache_path = self._get_cache_path(key)
         
         if not cache_path.exists():
@@ -26,7 +26,7 @@ class DataCache:
             
             # Check if cache is still fresh
             cached_time = datetime.fromisoformat(cached['cached_at'])
-            if datetime.now() - cached_time < self.cache_duration:
+            if not check_expiry or datetime.now() - cached_time < self.cache_duration:
                 print(f"✓ Using cached data for {key} (cached {cached_time.strftime('%Y-%m-%d %H:%M')})")
                 return cached['data']
             else:
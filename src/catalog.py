@@ -0,0 +1,232 @@
+"""
+Indicator catalog.
+
+indicators.toml is loaded once into an immutable Catalog with every lookup the
+pipeline needs precomputed (by series ID, section and chart), so
+fetching, charting and the template plan their work from one definition and
+never scan the indicator list.
+"""
+import tomllib
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+CATALOG_PATH = Path(__file__).resolve().parent.parent / 'indicators.toml'
+
+VALID_UNITS = {None, 'percent'}
+
+@dataclass(frozen=True)
+class Indicator:
+    series_id: str
+    name: str
+    section: str
+    release_lag_days: int = 0
+    units: str = None
+    color: str = '#3498db'
+    chart_label: str = None
+    chart: bool = True
+    group: str = None
+
+@dataclass(frozen=True)
+class Group:
+    name: str
+    members: tuple  # Indicators, leader first
+
+@dataclass(frozen=True)
+class SpreadLine:
+    over: str   # series ID subtracted from the spread chart's base
+    label: str
+    color: str
+
+@dataclass(frozen=True)
+class SpreadChart:
+    name: str   # chart key
+    title: str
+    base: str   # series ID
+    lines: tuple
+    description: str = ''
+
+    @property
+    def series_ids(self):
+        return (self.base,) + tuple(line.over for line in self.lines)
+
+@dataclass(frozen=True)
+class Catalog:
+    sections: tuple
+    indicators: tuple
+    groups: tuple
+    spread_charts: tuple              # calculated charts shown under Special Analysis
+    by_id: MappingProxyType
+    by_section: MappingProxyType      # section -> Indicators shown as cards (group followers excluded)
+    chart_for: MappingProxyType       # indicator name -> chart key
+    individual_charts: tuple          # Indicators with their own chart
+    series_ids: tuple
+    percent_series_ids: tuple
+    chart_series_ids: tuple
+
+def _freeze(mapping):
+    return MappingProxyType(dict(mapping))
+
+def _tables(value, label, header, errors):
+    """value as a list of tables, or None (recording an error) if it is anything else"""
+    if isinstance(value, list) and all(isinstance(item, dict) for item in value):
+        return value
+    errors.append(f"{label} must be written as [[{header}]] tables")
+    return None
+
+def build_catalog(raw):
+    """Validate a parsed catalog and build its indexes (raises ValueError listing every problem)"""
+    errors = []
+
+    sections = tuple(raw.get('sections', []))
+    if len(set(sections)) != len(sections):
+        errors.append("duplicate entries in 'sections'")
+
+    # Groups, keyed by member series ID
+    raw_groups = []
+    group_names = set()
+    group_of = {}
+    for position, group in enumerate(_tables(raw.get('group', []), "'group'", 'group', errors) or [], start=1):
+        if not group.get('name'):
+            errors.append(f"group #{position} has no name")
+            continue
+        if group['name'] in group_names:
+            errors.append(f"duplicate group name {group['name']!r}")
+            continue
+        group_names.add(group['name'])
+        members = group.get('members')
+        if not (members and isinstance(members, list) and all(isinstance(m, str) for m in members)):
+            errors.append(f"group {group['name']!r} members must be a non-empty list of series IDs")
+            continue
+        for series_id in members:
+            if series_id in group_of:
+                errors.append(f"{series_id} is in both {group_of[series_id]!r} and {group['name']!r}")
+            group_of[series_id] = group['name']
+        raw_groups.append(group)
+
+    # Indicators
+    by_id = {}
+    names = set()
+    for entry in _tables(raw.get('indicator', []), "'indicator'", 'indicator', errors) or []:
+        missing = [field for field in ('id', 'name', 'section', 'release_lag_days') if field not in entry]
+        if missing:
+            errors.append(f"indicator {entry} is missing {', '.join(missing)}")
+            continue
+
+        indicator = Indicator(
+            series_id=entry['id'],
+            name=entry['name'],
+            section=entry['section'],
+            release_lag_days=entry['release_lag_days'],
+            units=entry.get('units'),
+            color=entry.get('color', Indicator.color),
+            chart_label=entry.get('chart_label', entry['name']),
+            chart=entry.get('chart', True),
+            group=group_of.get(entry['id']),
+        )
+
+        if indicator.series_id in by_id:
+            errors.append(f"duplicate series ID {indicator.series_id}")
+        if indicator.name in names:
+            errors.append(f"duplicate indicator name {indicator.name!r}")
+        if indicator.section not in sections:
+            errors.append(f"{indicator.series_id}: unknown section {indicator.section!r}")
+        if type(indicator.release_lag_days) is not int or indicator.release_lag_days < 0:
+            errors.append(f"{indicator.series_id}: release_lag_days must be a non-negative integer")
+        if indicator.units not in VALID_UNITS:
+            errors.append(f"{indicator.series_id}: unknown units {indicator.units!r}")
+        if not isinstance(indicator.chart, bool):
+            errors.append(f"{indicator.series_id}: chart must be true or false")
+
+        by_id[indicator.series_id] = indicator
+        names.add(indicator.name)
+
+    groups = []
+    for group in raw_groups:
+        unknown = [series_id for series_id in group['members'] if series_id not in by_id]
+        if unknown:
+            errors.append(f"group {group['name']!r} references unknown series {', '.join(unknown)}")
+            continue
+        members = tuple(by_id[series_id] for series_id in group['members'])
+        if len({member.section for member in members}) > 1:
+            errors.append(f"group {group['name']!r} mixes sections {', '.join(sorted({m.section for m in members}))}")
+            continue
+        groups.append(Group(name=group['name'], members=members))
+
+    # Calculated spread charts
+    spread_charts = []
+    for position, entry in enumerate(_tables(raw.get('spread_chart', []), "'spread_chart'", 'spread_chart', errors) or [], start=1):
+        label = entry.get('name', f"#{position}")
+        missing = [field for field in ('name', 'title', 'base', 'line') if not entry.get(field)]
+        if missing:
+            errors.append(f"spread chart {label!r} is missing {', '.join(missing)}")
+            continue
+        raw_lines = _tables(entry['line'], f"spread chart {label!r} line", 'spread_chart.line', errors)
+        if raw_lines is None:
+            continue
+        lines = []
+        for line in raw_lines:
+            if not all(line.get(field) for field in ('over', 'label', 'color')):
+                errors.append(f"spread chart {label!r} has a line without over, label and color")
+                continue
+            lines.append(SpreadLine(over=line['over'], label=line['label'], color=line['color']))
+        chart = SpreadChart(name=entry['name'], title=entry['title'], base=entry['base'],
+                            lines=tuple(lines), description=entry.get('description', ''))
+        unknown = [series_id for series_id in chart.series_ids if series_id not in by_id]
+        if unknown:
+            errors.append(f"spread chart {label!r} references unknown series {', '.join(unknown)}")
+            continue
+        spread_charts.append(chart)
+
+    indicators = tuple(by_id.values())
+    individual_charts = tuple(i for i in indicators if i.chart is True and i.group is None)
+
+    # Chart keys: group name for grouped indicators, own name for the rest, plus spread charts
+    chart_keys = [group.name for group in groups] + [i.name for i in individual_charts] + [c.name for c in spread_charts]
+    duplicates = sorted(key for key, count in Counter(chart_keys).items() if count > 1)
+    if duplicates:
+        errors.append(f"chart names used more than once: {', '.join(duplicates)}")
+
+    if errors:
+        raise ValueError("Invalid indicator catalog:\n  " + "\n  ".join(errors))
+
+    followers = {member.series_id for group in groups for member in group.members[1:]}
+    by_section = {section: [] for section in sections}
+    for indicator in indicators:
+        if indicator.series_id not in followers:
+            by_section[indicator.section].append(indicator)
+
+    chart_for = {i.name: i.name for i in individual_charts}
+    chart_for.update({member.name: group.name for group in groups for member in group.members})
+
+    return Catalog(
+        sections=sections,
+        indicators=indicators,
+        groups=tuple(groups),
+        spread_charts=tuple(spread_charts),
+        by_id=_freeze(by_id),
+        by_section=_freeze({section: tuple(members) for section, members in by_section.items()}),
+        chart_for=_freeze(chart_for),
+        individual_charts=individual_charts,
+        series_ids=tuple(by_id),
+        percent_series_ids=tuple(i.series_id for i in indicators if i.units == 'percent'),
+        chart_series_ids=tuple(dict.fromkeys(
+            [member.series_id for group in groups for member in group.members]
+            + [i.series_id for i in individual_charts]
+            + [series_id for chart in spread_charts for series_id in chart.series_ids]
+        )),
+    )
+
+@lru_cache(maxsize=None)
+def load_catalog(path=CATALOG_PATH):
+    """Load and validate the catalog (once per process)"""
+    with open(path, 'rb') as f:
+        return build_catalog(tomllib.load(f))
+
+if __name__ == '__main__':
+    catalog = load_catalog()
+    print(f"✓ Catalog valid: {len(catalog.indicators)} indicators, "
+          f"{len(catalog.groups)} groups, {len(catalog.spread_charts)} spread charts, "
+          f"{len(catalog.sections)} sections")
@@ -6,6 +6,8 @@ import os
 from dotenv import load_dotenv
 import time
 from cache import DataCache  # Add this import
+from indicator_stats import get_indicator_stats
+from catalog import load_catalog
 
 load_dotenv()
 
@@ -15,6 +17,7 @@ class EconomicDataFetcher:
         print(f"FRED API Key loaded: {fred_key[:8] if fred_key else 'None'}... (length: {len(fred_key) if fred_key else 0})")
         self.fred = Fred(api_key=fred_key)
         self.cache = DataCache(cache_duration_hours=cache_duration_hours) if use_cache else None
+        self.histories = {}  # Full histories fetched this run, reused for charts
         
     # def fetch_market_data(self):
     #     """Fetch major market indices and commodities"""
@@ -91,63 +94,92 @@ class EconomicDataFetcher:
             if cached_data:
                 return cached_data
         
-        indicators = {
-            # Labor Market
-            'UNRATE': {'name': 'Unemployment Rate', 'section': 'Labor Market'},
-            'ICSA': {'name': 'Initial Jobless Claims', 'section': 'Labor Market'},
-            
-            # Inflation & Growth
-            'CPIAUCSL': {'name': 'CPI (Inflation)', 'section': 'Inflation & Growth'},
-            'PCEPI': {'name': 'Personal Consumption Expenditure', 'section': 'Inflation & Growth'},
-            'PCEPILFE': {'name': 'CORE PCE', 'section': 'Inflation & Growth'},
-            
-            # Interest Rates
-            'DFF': {'name': 'Fed Funds Rate', 'section': 'Interest Rates'},
-            'DGS10': {'name': 'Term Premium', 'section': 'Interest Rates'},
-            'DGS30': {'name': '30-Year Treasury Yield', 'section': 'Interest Rates'},
-            'MORTGAGE30US': {'name': '30-Year Mortgage Rate', 'section': 'Interest Rates'},
-            
-            # Yield Curve Spreads
-            'T10Y2Y': {'name': '10Y-2Y Treasury Spread', 'section': 'Yield Curve'},
-            'T10Y3M': {'name': '10Y-3M Treasury Spread', 'section': 'Yield Curve'},
-            
-            # Housing
-            'HOUST': {'name': 'Housing Starts', 'section': 'Housing'},
-            'EXHOSLUSM495S': {'name': 'Existing Home Sales', 'section': 'Housing'},
-            
-            # Consumer & Savings
-            'UMCSENT': {'name': 'Consumer Sentiment', 'section': 'Consumer & Savings'},
-            'PSAVERT': {'name': 'Personal Savings Rate', 'section': 'Consumer & Savings'},
-            
-            # Monetary
-            'M2SL': {'name': 'M2 Money Supply', 'section': 'Monetary'}
-        }
+        catalog = load_catalog()
         
-        economic_data = {}
-        for series_id, info in indicators.items():
+        histories = {}
+        for indicator in catalog.indicators:
             try:
-                data = self.fred.get_series(series_id)
-                if not data.empty:
-                    current = data.iloc[-1]
-                    previous = data.iloc[-2] if len(data) > 1 else current
-                    change = current - previous
-                    
-                    economic_data[info['name']] = {
-                        'current': round(current, 2),
-                        'change': round(change, 2),
-                        'date': data.index[-1].strftime('%Y-%m-%d'),
-                        'section': info['section']  # Add section info
-                    }
-                    print(f"✓ Successfully fetched {info['name']}")
+                histories[indicator.series_id] = self.fetch_series_history(indicator.series_id)
+                print(f"✓ Successfully fetched {indicator.name}")
             except Exception as e:
-                print(f"✗ Error fetching {info['name']}: {str(e)[:100]}")
+                print(f"✗ Error fetching {indicator.name}: {str(e)[:100]}")
+        
+        self.histories = histories
+        
+        # Latest values and statistical context for every series in one pass
+        stats = get_indicator_stats(histories, catalog.percent_series_ids, cache=self.cache)
+        
+        economic_data = {}
+        for indicator in catalog.indicators:
+            if indicator.series_id in stats:
+                economic_data[indicator.name] = {
+                    **stats[indicator.series_id],
+                    'section': indicator.section  # Add section info
+                }
         
         # Cache the result
         if self.cache and economic_data:
             self.cache.set('economic_indicators', economic_data)
                 
         return economic_data
-    
+
+    def fetch_series_history(self, series_id):
+        """Fetch the full history of a FRED series (latest revised values)"""
+
+        # Check cache first
+        cache_key = f'history_{series_id}'
+        if self.cache:
+            cached_data = self.cache.get(cache_key)
+            if cached_data:
+                return pd.Series(cached_data['values'], index=pd.to_datetime(cached_data['dates']), dtype=float)
+
+        data = self.fred.get_series(series_id).dropna()
+
+        # Cache the result
+        if self.cache and not data.empty:
+            self.cache.set(cache_key, {
+                'dates': data.index.strftime('%Y-%m-%d').tolist(),
+                'values': data.astype(float).tolist()
+            })
+
+        return data
+
+    def fetch_series_releases(self, series_id):
+        """
+        Fetch every published release of a series' observations (ALFRED)
+        Returns a DataFrame with 'date', 'available_at' and 'value' columns,
+        sorted by observation date, then publication date
+        """
+
+        # Check cache first
+        cache_key = f'releases_{series_id}'
+        if self.cache:
+            cached_data = self.cache.get(cache_key)
+            if cached_data:
+                return pd.DataFrame({
+                    'date': pd.to_datetime(cached_data['dates']),
+                    'available_at': pd.to_datetime(cached_data['available_at']),
+                    'value': pd.Series(cached_data['values'], dtype=float)
+                })
+
+        releases = self.fred.get_series_all_releases(series_id)
+        releases = releases.dropna(subset=['value'])
+        releases = pd.DataFrame({
+            'date': pd.to_datetime(releases['date']).values,
+            'available_at': pd.to_datetime(releases['realtime_start']).values,
+            'value': releases['value'].astype(float).values
+        }).sort_values(['date', 'available_at'], ignore_index=True)
+
+        # Cache the result
+        if self.cache and not releases.empty:
+            self.cache.set(cache_key, {
+                'dates': releases['date'].dt.strftime('%Y-%m-%d').tolist(),
+                'available_at': releases['available_at'].dt.strftime('%Y-%m-%d').tolist(),
+                'values': releases['value'].tolist()
+            })
+
+        return releases
+
     def fetch_all_data(self):
         # """Fetch all data and combine"""
         # print("Fetching market data...")
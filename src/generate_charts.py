@@ -6,81 +6,9 @@ from datetime import datetime, timedelta
 import base64
 from io import BytesIO
 from cache import DataCache
+from catalog import load_catalog
 import pandas as pd
 
-# Chart grouping configuration
-CHART_GROUPS = {
-    # Group name: [(series_id, display_name, color), ...]
-    'Personal Consumption Expenditure': [
-        ('PCEPI', 'PCE',  '#1aa526'),
-        ('PCEPILFE', 'CORE PCE', '#60159e'),
-    ],
-    'Term Premium': [
-        ('DGS10', '10-Year Treasury Yield', '#cca22e' ),
-        ('DGS30', '30-Year Treasury Yield', '#2927ae' ),
-    ],
-}
-
-# Map: which grouped indicators should appear together and which chart to use
-INDICATOR_GROUPS = {
-    'Personal Consumption Expenditure': [
-        'Personal Consumption Expenditure',
-        'CORE PCE',
-    ],
-    'Term Premium': [
-        'Term Premium',
-        '30-Year Treasury Yield',
-    ],
-}
-
-# Map: indicator name to its group chart
-GROUP_TO_CHART = {
-    'Personal Consumption Expenditure': 'Personal Consumption Expenditure',
-    'CORE PCE': 'Personal Consumption Expenditure',
-    'Term Premium': 'Term Premium',
-    '30-Year Treasury Yield': 'Term Premium',
-}
-
-# Indicators that should be hidden (only shown in grouped display)
-HIDDEN_INDICATORS = [
-    'CORE PCE',
-    '30-Year Treasury Yield',
-]
-
-# Individual charts (not grouped)
-INDIVIDUAL_CHARTS = {
-# Labor Market
-        'UNRATE': {'name': 'Unemployment Rate', 'color': '#e74c3c'},
-        'ICSA': {'name': 'Initial Jobless Claims', 'color': '#f39c12'},
-        
-        # Inflation & Growth
-        'CPIAUCSL': {'name': 'CPI (Inflation)', 'color': '#e67e22'},
-        # 'PCEPI': {'name': 'Personal Consumption Expenditure', 'color': "#1aa526"},
-        # 'DPCCRV1Q225SBEA': {'name': 'CORE PCE', 'color': "#60159e"},
-
-        # Interest Rates
-        'DFF': {'name': 'Fed Funds Rate', 'color': '#3498db'},
-        # 'DGS10': {'name': '10-Year Treasury Yield', 'color': "#cca22e"},
-        # 'DGS30': {'name': '30-Year Treasury Yield', 'color': "#2927ae"},
-        'MORTGAGE30US': {'name': '30-Year Mortgage Rate', 'color': '#e91e63'},
-        
-        # Yield Curve Spreads
-        'T10Y2Y': {'name': '10Y-2Y Treasury Spread', 'color': '#8e44ad'},
-        'T10Y3M': {'name': '10Y-3M Treasury Spread', 'color': '#9b59b6'},
-        # 'T10Y30Y': {'name': '10Y-30Y Treasury Spread', 'color': '#7d3c98'},
-        
-        # Housing
-        'HOUST': {'name': 'Housing Starts', 'color': '#1abc9c'},
-        'EXHOSLUSM495S': {'name': 'Existing Home Sales', 'color': '#16a085'},
-        
-        # Consumer & Savings
-        'UMCSENT': {'name': 'Consumer Sentiment', 'color': '#f39c12'},
-        'PSAVERT': {'name': 'Personal Savings Rate', 'color': '#d35400'},
-        
-        # Monetary
-        'M2SL': {'name': 'M2 Money Supply', 'color': '#34495e'},
-}
-
 def create_chart(series_data, title, color='#3498db'):
     """Create a clean line chart and return as base64 string"""
     
@@ -172,90 +100,111 @@ def create_multi_line_chart(series_list, title):
     
     return image_base64
 
-def generate_all_charts(fred_api_key, use_cache=True):
-    """Generate charts for all economic indicators"""
-    
-    cache = DataCache(cache_duration_hours=24) if use_cache else None
-    
-    # Check cache first
-    if cache:
-        cached_charts = cache.get('all_charts')
-        if cached_charts:
-            return cached_charts
+def render_charts(series_by_id, start_date, end_date=None, verbose=True):
+    """
+    Render all charts from already-fetched series
+    series_by_id: {series_id: pd.Series}, windowed here to [start_date, end_date]
+    verbose: print per-chart progress (errors are always printed)
+    """
     
-    fred = Fred(api_key=fred_api_key)
+    catalog = load_catalog()
     charts = {}
     
-    # Get data from last 2 years for context
-    start_date = (datetime.now() - timedelta(days=730)).strftime('%Y-%m-%d')
+    def window(series_id):
+        data = series_by_id.get(series_id)
+        if data is None:
+            return pd.Series(dtype=float)
+        return data.loc[start_date:end_date]
     
     # Generate grouped charts
-    for group_name, series_configs in CHART_GROUPS.items():
+    for group in catalog.groups:
         try:
-            print(f"Generating grouped chart: {group_name}...")
+            if verbose:
+                print(f"Generating grouped chart: {group.name}...")
             series_list = []
             
-            for series_id, display_name, color in series_configs:
-                data = fred.get_series(series_id, observation_start=start_date)
+            for member in group.members:
+                data = window(member.series_id)
                 if not data.empty:
-                    series_list.append((data, display_name, color))
+                    series_list.append((data, member.chart_label, member.color))
             
             if series_list:
-                chart_base64 = create_multi_line_chart(series_list, group_name)
-                charts[group_name] = chart_base64
-                print(f"✓ Chart generated for {group_name}")
+                chart_base64 = create_multi_line_chart(series_list, group.name)
+                charts[group.name] = chart_base64
+                if verbose:
+                    print(f"✓ Chart generated for {group.name}")
         except Exception as e:
-            print(f"✗ Error generating grouped chart {group_name}: {str(e)[:100]}")
+            print(f"✗ Error generating grouped chart {group.name}: {str(e)[:100]}")
     
     # Generate individual charts
-    for series_id, info in INDIVIDUAL_CHARTS.items():
+    for indicator in catalog.individual_charts:
         try:
-            print(f"Generating chart for {info['name']}...")
-            data = fred.get_series(series_id, observation_start=start_date)
+            if verbose:
+                print(f"Generating chart for {indicator.name}...")
+            data = window(indicator.series_id)
             
             if not data.empty:
-                chart_base64 = create_chart(data, info['name'], info['color'])
-                charts[info['name']] = chart_base64
-                print(f"✓ Chart generated for {info['name']}")
+                chart_base64 = create_chart(data, indicator.name, indicator.color)
+                charts[indicator.name] = chart_base64
+                if verbose:
+                    print(f"✓ Chart generated for {indicator.name}")
         except Exception as e:
-            print(f"✗ Error generating chart for {info['name']}: {str(e)[:100]}")
-    
-    # Generate special calculated chart: Mortgage Spreads over Treasuries
-    try:
-        print("Generating Mortgage Spread chart...")
-        mortgage_data = fred.get_series('MORTGAGE30US', observation_start=start_date)
-        treasury_30y = fred.get_series('DGS30', observation_start=start_date)
-        treasury_10y = fred.get_series('DGS10', observation_start=start_date)
-        
-        if not mortgage_data.empty and not treasury_30y.empty and not treasury_10y.empty:
-            # Calculate spreads (mortgage - treasury)
-            combined = pd.DataFrame({
-                'mortgage': mortgage_data,
-                'treasury_30y': treasury_30y,
-                'treasury_10y': treasury_10y
-            })
-            
-            # Forward fill to handle missing data points
-            combined = combined.fillna(method='ffill')
-            
-            # Calculate spreads
-            spread_30y = combined['mortgage'] - combined['treasury_30y']
-            spread_10y = combined['mortgage'] - combined['treasury_10y']
-            
-            # Remove NaN values
-            spread_30y = spread_30y.dropna()
-            spread_10y = spread_10y.dropna()
-            
-            series_list = [
-                (spread_30y, 'Premium over 30Y Treasury', '#e91e63'),
-                (spread_10y, 'Premium over 10Y Treasury', '#9b59b6')
-            ]
+            print(f"✗ Error generating chart for {indicator.name}: {str(e)[:100]}")
+    
+    # Generate calculated spread charts (e.g. Mortgage Rate Premium over Treasuries)
+    for spread in catalog.spread_charts:
+        try:
+            if verbose:
+                print(f"Generating spread chart: {spread.name}...")
+            base_data = window(spread.base)
             
-            spread_chart = create_multi_line_chart(series_list, 'Mortgage Rate Premium over Treasuries')
-            charts['Mortgage Rate Premium'] = spread_chart
-            print("✓ Chart generated for Mortgage Rate Premium")
-    except Exception as e:
-        print(f"✗ Error generating spread chart: {str(e)[:100]}")
+            if not base_data.empty:
+                # Forward fill to handle missing data points
+                combined = pd.DataFrame({series_id: window(series_id) for series_id in spread.series_ids}).ffill()
+                
+                series_list = []
+                for line in spread.lines:
+                    # Calculate spread (base - other), removing NaN values
+                    spread_data = (combined[spread.base] - combined[line.over]).dropna()
+                    if not spread_data.empty:
+                        series_list.append((spread_data, line.label, line.color))
+                
+                if series_list:
+                    charts[spread.name] = create_multi_line_chart(series_list, spread.title)
+                    if verbose:
+                        print(f"✓ Chart generated for {spread.name}")
+        except Exception as e:
+            print(f"✗ Error generating spread chart {spread.name}: {str(e)[:100]}")
+    
+    return charts
+
+def generate_all_charts(fred_api_key, use_cache=True, histories=None):
+    """
+    Generate charts for all economic indicators
+    histories: {series_id: pd.Series} already fetched this run; only missing series are fetched
+    """
+    
+    cache = DataCache(cache_duration_hours=24) if use_cache else None
+    
+    # Check cache first
+    if cache:
+        cached_charts = cache.get('all_charts')
+        if cached_charts:
+            return cached_charts
+    
+    # Get data from last 2 years for context
+    start_date = (datetime.now() - timedelta(days=730)).strftime('%Y-%m-%d')
+    
+    series_by_id = dict(histories or {})
+    missing = [series_id for series_id in load_catalog().chart_series_ids if series_id not in series_by_id]
+    fred = Fred(api_key=fred_api_key) if missing else None
+    for series_id in missing:
+        try:
+            series_by_id[series_id] = fred.get_series(series_id, observation_start=start_date)
+        except Exception as e:
+            print(f"✗ Error fetching {series_id}: {str(e)[:100]}")
+    
+    charts = render_charts(series_by_id, start_date)
     
     # Cache the charts
     if cache and charts:
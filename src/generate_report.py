@@ -2,40 +2,47 @@ from jinja2 import Template
 from datetime import datetime
 import json
 import os
-from generate_charts import generate_all_charts, INDICATOR_GROUPS, HIDDEN_INDICATORS, GROUP_TO_CHART
+from functools import lru_cache
+from generate_charts import generate_all_charts
+from catalog import load_catalog
 
-def generate_html_report(data, include_charts=True):
-    """Generate HTML email report from data"""
-    
-    # Read the template
-    with open('templates/email_template.html', 'r') as f:
-        template_content = f.read()
+@lru_cache(maxsize=None)
+def load_template(path='templates/email_template.html'):
+    """Read and compile the email template (once per process)"""
+    with open(path, 'r') as f:
+        return Template(f.read())
+
+def generate_html_report(data, include_charts=True, charts=None, report_date=None, histories=None):
+    """
+    Generate HTML email report from data
+    charts / report_date: pass precomputed values (e.g. for backfilled editions)
+    histories: series already fetched this run (e.g. EconomicDataFetcher.histories), reused for charts
+    """
     
-    template = Template(template_content)
+    template = load_template()
     
     # Format the report date
-    report_date = datetime.now().strftime('%B %d, %Y')
-    
-    # Generate charts if requested
-    charts = {}
-    if include_charts:
-        from dotenv import load_dotenv
-        load_dotenv()
-        print("Generating charts...")
-        charts = generate_all_charts(os.getenv('FRED_API_KEY'))
+    report_date = (report_date or datetime.now()).strftime('%B %d, %Y')
+    
+    # Generate charts if requested (unless precomputed ones were passed in)
+    if charts is None:
+        charts = {}
+        if include_charts:
+            from dotenv import load_dotenv
+            load_dotenv()
+            print("Generating charts...")
+            charts = generate_all_charts(os.getenv('FRED_API_KEY'), histories=histories)
         
-        # Debug: print what charts we got
-        print(f"\nCharts generated: {list(charts.keys())}")
-        print(f"Economic indicators: {list(data.get('economic', {}).keys())}")
+            # Debug: print what charts we got
+            print(f"\nCharts generated: {list(charts.keys())}")
+            print(f"Economic indicators: {list(data.get('economic', {}).keys())}")
     
     # Render the template
     html = template.render(
         report_date=report_date,
         economic=data.get('economic', {}),
         charts=charts,
-        indicator_groups=INDICATOR_GROUPS,
-        hidden_indicators=HIDDEN_INDICATORS,
-        group_to_chart=GROUP_TO_CHART,
+        catalog=load_catalog(),
     )
     
     return html, charts
@@ -47,7 +54,7 @@ if __name__ == '__main__':
     fetcher = EconomicDataFetcher()
     data = fetcher.fetch_all_data()
     
-    html, charts = generate_html_report(data, include_charts=True)
+    html, charts = generate_html_report(data, include_charts=True, histories=fetcher.histories)
     
     # Save to file to preview
     with open('test_report.html', 'w', encoding='utf-8') as f:
@@ -0,0 +1,190 @@
+"""
+Statistical context for the indicator cards.
+
+All histories are aligned into one panel (dates x series) and every statistic is
+computed for all series at once with NumPy, so adding indicators adds columns,
+not Python loops. Results are cached next to the stored histories under a hash
+of their contents, so they are reused until any value changes (new observation
+or revision), however old the cache entry is.
+"""
+import hashlib
+import warnings
+
+import numpy as np
+import pandas as pd
+
+ZSCORE_WINDOW = pd.Timedelta(days=3 * 365)
+HIGH_LOW_WINDOW = pd.Timedelta(weeks=52)
+
+STAT_FIELDS = ['percentile', 'zscore', 'yoy', 'change_3m_ann', 'from_high', 'from_low']
+
+def build_history_panel(histories):
+    """Align {series_id: pd.Series} on the union of their dates (NaN where a series has no observation)"""
+    panel = pd.DataFrame({series_id: data for series_id, data in histories.items() if not data.empty})
+    return panel.sort_index()
+
+def compute_indicator_stats(panel, percent_series=()):
+    """
+    Compute every statistic for every column of the panel in one pass
+    percent_series: series already in percent, whose changes are reported in
+    percentage points instead of percent changes
+    Returns a DataFrame indexed by series_id
+    """
+    values = panel.to_numpy(dtype=float)
+    dates = panel.index.values.astype('datetime64[ns]')
+    observed = ~np.isnan(values)
+    cols = np.arange(values.shape[1])
+    rows = np.arange(values.shape[0])[:, None]
+
+    # Latest and previous observation of each series
+    last_row = np.where(observed, rows, -1).max(axis=0)
+    prev_row = np.where(observed & (rows < last_row), rows, -1).max(axis=0)
+    current = values[last_row, cols]
+    previous = np.where(prev_row >= 0, values[np.maximum(prev_row, 0), cols], current)
+    last_date = pd.DatetimeIndex(dates[last_row])
+
+    # Value as of an earlier date, per series (forward-filled panel lookup)
+    filled = panel.ffill().to_numpy(dtype=float)
+
+    def value_as_of(targets):
+        pos = np.searchsorted(dates, targets.values.astype('datetime64[ns]'), side='right') - 1
+        return np.where(pos >= 0, filled[np.maximum(pos, 0), cols], np.nan)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', pd.errors.PerformanceWarning)
+        year_ago = value_as_of(last_date - pd.DateOffset(years=1))
+        quarter_ago = value_as_of(last_date - pd.DateOffset(months=3))
+
+    is_percent = np.isin(panel.columns.to_numpy(), list(percent_series))
+
+    with np.errstate(divide='ignore', invalid='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+
+        def relative(a, b):
+            return np.where(is_percent, a - b, (a / b - 1) * 100)
+
+        # Percentile rank versus the full history
+        percentile = (values <= current).sum(axis=0) / observed.sum(axis=0) * 100
+
+        # Rolling z-score over the trailing window
+        in_window = observed & (dates[:, None] > (last_date - ZSCORE_WINDOW).values[None, :])
+        window_values = np.where(in_window, values, np.nan)
+        mean = np.nanmean(window_values, axis=0)
+        std = np.nanstd(window_values, axis=0, ddof=1)
+        zscore = np.where(std > 0, (current - mean) / std, np.nan)
+
+        # Distance from the 52-week high and low
+        in_year = observed & (dates[:, None] > (last_date - HIGH_LOW_WINDOW).values[None, :])
+        year_values = np.where(in_year, values, np.nan)
+        high = np.nanmax(year_values, axis=0)
+        low = np.nanmin(year_values, axis=0)
+
+        yoy = relative(current, year_ago)
+        change_3m_ann = np.where(is_percent, current - quarter_ago, ((current / quarter_ago) ** 4 - 1) * 100)
+        from_high = relative(current, high)
+        from_low = relative(current, low)
+
+    return pd.DataFrame({
+        'current': current,
+        'change': current - previous,
+        'date': last_date.strftime('%Y-%m-%d'),
+        'percentile': percentile,
+        'zscore': zscore,
+        'yoy': yoy,
+        'change_3m_ann': change_3m_ann,
+        'from_high': from_high,
+        'from_low': from_low,
+        'units': np.where(is_percent, 'pp', '%'),
+    }, index=panel.columns)
+
+def compute_series_stats(data, percent=False):
+    """
+    Compute the statistics of one series as they stood at each of its observations
+    (expanding/rolling over the history up to that observation), with the same
+    definitions as compute_indicator_stats
+    Returns a DataFrame of STAT_FIELDS indexed like data
+    """
+    data = data.astype(float)
+    values = data.to_numpy()
+    dates = data.index.values.astype('datetime64[ns]')
+
+    def value_as_of(targets):
+        pos = np.searchsorted(dates, targets.values.astype('datetime64[ns]'), side='right') - 1
+        return np.where(pos >= 0, values[np.maximum(pos, 0)], np.nan)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', pd.errors.PerformanceWarning)
+        year_ago = value_as_of(data.index - pd.DateOffset(years=1))
+        quarter_ago = value_as_of(data.index - pd.DateOffset(months=3))
+
+    window = data.rolling(ZSCORE_WINDOW)
+    mean = window.mean().to_numpy()
+    std = window.std().to_numpy()
+    year = data.rolling(HIGH_LOW_WINDOW)
+    high = year.max().to_numpy()
+    low = year.min().to_numpy()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+
+        def relative(a, b):
+            return a - b if percent else (a / b - 1) * 100
+
+        return pd.DataFrame({
+            'percentile': data.expanding().rank(method='max', pct=True).to_numpy() * 100,
+            'zscore': np.where(std > 0, (values - mean) / std, np.nan),
+            'yoy': relative(values, year_ago),
+            'change_3m_ann': values - quarter_ago if percent else ((values / quarter_ago) ** 4 - 1) * 100,
+            'from_high': relative(values, high),
+            'from_low': relative(values, low),
+        }, index=data.index)
+
+def stats_to_dict(stats):
+    """Convert the stats frame to JSON-friendly {series_id: {...}} (rounded, NaN -> None)"""
+    result = {}
+    for series_id, row in stats.iterrows():
+        result[series_id] = {
+            'current': round(float(row['current']), 2),
+            'change': round(float(row['change']), 2),
+            'date': row['date'],
+            'stats': {
+                **{field: None if pd.isna(row[field]) else round(float(row[field]), 2) for field in STAT_FIELDS},
+                'units': row['units'],
+            },
+        }
+    return result
+
+def histories_signature(histories, percent_series=()):
+    """Hash of every series' dates and values (plus the percent settings)"""
+    digest = hashlib.sha256()
+    for series_id in sorted(histories):
+        data = histories[series_id]
+        digest.update(series_id.encode())
+        digest.update(data.index.values.astype('datetime64[ns]').tobytes())
+        digest.update(data.to_numpy(dtype=float).tobytes())
+    digest.update(','.join(sorted(percent_series)).encode())
+    return digest.hexdigest()
+
+def get_indicator_stats(histories, percent_series=(), cache=None):
+    """
+    Stats for every series, reusing the cached result while the histories are unchanged
+    Returns {series_id: {'current', 'change', 'date', 'stats'}}
+    """
+    signature = histories_signature(histories, percent_series)
+
+    # Check cache first (validated by the signature, so it never expires)
+    if cache:
+        cached_data = cache.get('indicator_stats', check_expiry=False)
+        if cached_data and cached_data.get('signature') == signature:
+            return cached_data['stats']
+
+    panel = build_history_panel(histories)
+    if panel.empty:
+        return {}
+
+    stats = stats_to_dict(compute_indicator_stats(panel, percent_series))
+
+    # Cache the result
+    if cache and stats:
+        cache.set('indicator_stats', {'signature': signature, 'stats': stats})
+
+    return stats
@@ -30,7 +30,7 @@ def main():
     
     # Step 2: Generate report
     print("\n[2/3] Generating HTML report...")
-    html, charts = generate_html_report(data, include_charts=True)
+    html, charts = generate_html_report(data, include_charts=True, histories=fetcher.histories)
     print(f"✓ Report generated with {len(charts)} charts")
     
     # Step 3: Send email